@@ -4,6 +4,8 @@ import os
 from sklearn.model_selection import train_test_split
 import yaml
 
+from src.data.schema import DTYPES
+
 
 def load_params(filepath : str) -> float:
     try:
@@ -19,7 +21,7 @@ def load_params(filepath : str) -> float:
 def load_data(filepath : str) -> pd.DataFrame :
     try:
         # Works for both local files and URLs
-        return pd.read_csv(filepath)
+        return pd.read_csv(filepath, dtype=DTYPES)
     except Exception as e:
         if filepath.startswith('http'):
             raise Exception(f"Error loading data from URL {filepath}. Check internet connection and URL validity: {e}")
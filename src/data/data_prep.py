@@ -2,10 +2,12 @@ import pandas as pd
 import numpy as np
 import os
 
+from src.data.schema import DTYPES
+
 
 def load_data(filepath : str) -> pd.DataFrame:
     try:
-        return pd.read_csv(filepath)
+        return pd.read_csv(filepath, dtype=DTYPES)
     except Exception as e:
         raise Exception(f"Error loading data from {filepath}:{e}")
 # train_data = pd.read_csv("./data/raw/train.csv")
@@ -33,11 +35,11 @@ def save_data(df : pd.DataFrame, filepath: str) -> None:
 
 def main():
     try:
-        raw_data_path = "./data/raw/"
+        validated_data_path = "./data/interim/"
         processed_data_path = "./data/processed"
 
-        train_data = load_data(os.path.join(raw_data_path,"train.csv"))
-        test_data = load_data(os.path.join(raw_data_path,"test.csv"))
+        train_data = load_data(os.path.join(validated_data_path,"train.csv"))
+        test_data = load_data(os.path.join(validated_data_path,"test.csv"))
 
         train_processed_data = fill_missing_with_mean(train_data)
         test_processed_data = fill_missing_with_mean(test_data)
@@ -0,0 +1,144 @@
+import pandas as pd
+import numpy as np
+import os
+import json
+import yaml
+
+from src.data.schema import (
+    FEATURE_COLUMNS,
+    TARGET_COLUMN,
+    COLUMNS,
+    TARGET_VALUES,
+    LOWER_BOUNDS,
+    UPPER_BOUNDS,
+)
+
+
+def load_params(filepath: str) -> dict:
+    try:
+        with open(filepath, "r") as file:
+            params = yaml.safe_load(file)
+        return params["data_validation"]
+    except Exception as e:
+        raise Exception(f"Error loading parameters from {filepath}: {e}")
+
+
+def missing_budgets(max_missing_rate: dict) -> np.ndarray:
+    # Per-column budget aligned with FEATURE_COLUMNS, falling back to "default"
+    try:
+        default = max_missing_rate.get("default", 0.0)
+        return np.array([max_missing_rate.get(c, default) for c in FEATURE_COLUMNS])
+    except Exception as e:
+        raise Exception(f"Error building missing-rate budgets: {e}")
+
+
+def check_schema(chunk: pd.DataFrame) -> None:
+    missing = [c for c in COLUMNS if c not in chunk.columns]
+    extra = [c for c in chunk.columns if c not in COLUMNS]
+    if missing or extra:
+        raise ValueError(f"Schema mismatch: missing columns {missing}, unexpected columns {extra}")
+    non_numeric = [c for c in COLUMNS if not pd.api.types.is_numeric_dtype(chunk[c])]
+    if non_numeric:
+        raise ValueError(f"Non-numeric dtype in columns {non_numeric}")
+
+
+def find_violations(values: np.ndarray, target: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # NaN compares False on both sides, so missing values are never range violations
+    range_mask = (values < LOWER_BOUNDS) | (values > UPPER_BOUNDS)
+    target_mask = ~np.isin(target, TARGET_VALUES)
+    return range_mask, target_mask
+
+
+def validate_file(input_path: str, clean_path: str, quarantine_path: str,
+                  chunk_size: int, budgets: np.ndarray) -> dict:
+    try:
+        rows = 0
+        quarantined = 0
+        range_counts = np.zeros(len(FEATURE_COLUMNS), dtype=np.int64)
+        missing_counts = np.zeros(len(FEATURE_COLUMNS), dtype=np.int64)
+        target_count = 0
+
+        os.makedirs(os.path.dirname(clean_path), exist_ok=True)
+        os.makedirs(os.path.dirname(quarantine_path), exist_ok=True)
+
+        for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunk_size)):
+            check_schema(chunk)
+            chunk = chunk[COLUMNS]
+            values = chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float64)
+            target = chunk[TARGET_COLUMN].to_numpy(dtype=np.float64)
+
+            range_mask, target_mask = find_violations(values, target)
+            bad_rows = range_mask.any(axis=1) | target_mask
+
+            rows += len(chunk)
+            quarantined += int(bad_rows.sum())
+            range_counts += range_mask.sum(axis=0)
+            missing_counts += np.isnan(values).sum(axis=0)
+            target_count += int(target_mask.sum())
+
+            mode, header = ("w", True) if i == 0 else ("a", False)
+            chunk[~bad_rows].to_csv(clean_path, mode=mode, header=header, index=False)
+            chunk[bad_rows].to_csv(quarantine_path, mode=mode, header=header, index=False)
+
+        missing_rate = missing_counts / max(rows, 1)
+        over_budget = missing_rate > budgets
+
+        return {
+            "rows": rows,
+            "quarantined": quarantined,
+            "range_violations": {
+                c: int(n) for c, n in zip(FEATURE_COLUMNS, range_counts) if n
+            },
+            "target_violations": target_count,
+            "missing_rate": {
+                c: round(float(r), 4) for c, r in zip(FEATURE_COLUMNS, missing_rate) if r
+            },
+            "missing_budget_exceeded": [
+                c for c, over in zip(FEATURE_COLUMNS, over_budget) if over
+            ],
+        }
+    except Exception as e:
+        raise Exception(f"Error validating {input_path}: {e}")
+
+
+def save_report(report: dict, report_path: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, "w") as file:
+            json.dump(report, file, indent=4)
+    except Exception as e:
+        raise Exception(f"Error saving validation report to {report_path}: {e}")
+
+
+def main():
+    try:
+        params_filepath = "params.yaml"
+        raw_data_path = "./data/raw"
+        clean_data_path = "./data/interim"
+        quarantine_path = "./data/quarantine"
+        report_path = "reports/validation.json"
+
+        params = load_params(params_filepath)
+        budgets = missing_budgets(params["max_missing_rate"])
+
+        report = {}
+        for split in ("train", "test"):
+            report[split] = validate_file(
+                os.path.join(raw_data_path, f"{split}.csv"),
+                os.path.join(clean_data_path, f"{split}.csv"),
+                os.path.join(quarantine_path, f"{split}.csv"),
+                params["chunk_size"],
+                budgets,
+            )
+        save_report(report, report_path)
+
+        failed = {split: r["missing_budget_exceeded"] for split, r in report.items()
+                  if r["missing_budget_exceeded"]}
+        if failed:
+            raise ValueError(f"Missing-rate budget exceeded: {failed}")
+    except Exception as e:
+        raise Exception(f"An error occurred :{e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+from collections import defaultdict
+import numpy as np
+
+# Column layout of the water potability dataset
+FEATURE_COLUMNS = [
+    "ph",
+    "Hardness",
+    "Solids",
+    "Chloramines",
+    "Sulfate",
+    "Conductivity",
+    "Organic_carbon",
+    "Trihalomethanes",
+    "Turbidity",
+]
+TARGET_COLUMN = "Potability"
+COLUMNS = FEATURE_COLUMNS + [TARGET_COLUMN]
+
+# Physical ranges per feature (inclusive). ph is bounded by its scale,
+# everything else is a concentration / measurement and cannot be negative.
+PHYSICAL_RANGES = {
+    "ph": (0.0, 14.0),
+    "Hardness": (0.0, np.inf),
+    "Solids": (0.0, np.inf),
+    "Chloramines": (0.0, np.inf),
+    "Sulfate": (0.0, np.inf),
+    "Conductivity": (0.0, np.inf),
+    "Organic_carbon": (0.0, np.inf),
+    "Trihalomethanes": (0.0, np.inf),
+    "Turbidity": (0.0, np.inf),
+}
+TARGET_VALUES = (0, 1)
+
+# Bounds as arrays aligned with FEATURE_COLUMNS so a whole block of rows
+# can be checked with a single broadcast comparison
+LOWER_BOUNDS = np.array([PHYSICAL_RANGES[c][0] for c in FEATURE_COLUMNS])
+UPPER_BOUNDS = np.array([PHYSICAL_RANGES[c][1] for c in FEATURE_COLUMNS])
+
+# Compact dtypes applied at read time by every stage. Random forests work in
+# float32 internally, so float64 features only cost memory and I/O.
+FEATURE_DTYPE = "float32"
+TARGET_DTYPE = "int8"
+DTYPES = {**{c: FEATURE_DTYPE for c in FEATURE_COLUMNS}, TARGET_COLUMN: TARGET_DTYPE}
+
+# Engineered feature files carry extra columns; anything not listed above is
+# read as a float32 feature
+ENGINEERED_DTYPES = defaultdict(lambda: FEATURE_DTYPE, {TARGET_COLUMN: TARGET_DTYPE})
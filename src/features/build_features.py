@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+import yaml
+
+from src.data.schema import FEATURE_COLUMNS, TARGET_COLUMN, DTYPES, FEATURE_DTYPE
+
+# Bump whenever the feature logic below changes so cached matrices are not reused
+FEATURE_SPEC_VERSION = 1
+
+
+def load_params(params_path: str) -> dict:
+    try:
+        with open(params_path, "r") as file:
+            params = yaml.safe_load(file)
+        return params["features"]
+    except Exception as e:
+        raise Exception(f"Error loading parameters from {params_path}: {e}")
+
+
+def load_data(filepath: str) -> pd.DataFrame:
+    try:
+        return pd.read_csv(filepath, dtype=DTYPES)
+    except Exception as e:
+        raise Exception(f"Error loading data from {filepath}: {e}")
+
+
+def feature_names(spec: dict) -> list[str]:
+    return (
+        FEATURE_COLUMNS
+        + [f"{a}_per_{b}" for a, b in spec["ratios"]]
+        + [f"log_{c}" for c in spec["log"]]
+        + [f"{c}_missing" for c in spec["missing_flags"]]
+    )
+
+
+def compute_features(data: pd.DataFrame, missing: pd.DataFrame, spec: dict) -> np.ndarray:
+    """Raw columns followed by ratios, log transforms and missingness flags.
+
+    ``missing`` is the NaN mask from before imputation (same row order as
+    ``data``); with imputed data the flags could not be recovered.
+    """
+    values = data[FEATURE_COLUMNS].to_numpy(dtype=FEATURE_DTYPE)
+    index = {c: i for i, c in enumerate(FEATURE_COLUMNS)}
+    num = values[:, [index[a] for a, _ in spec["ratios"]]]
+    den = values[:, [index[b] for _, b in spec["ratios"]]]
+    ratios = np.divide(num, den, out=np.zeros_like(num), where=den != 0)
+    logs = np.log1p(np.clip(values[:, [index[c] for c in spec["log"]]], 0, None))
+    flags = missing[spec["missing_flags"]].to_numpy(dtype=FEATURE_DTYPE)
+    return np.hstack([values, ratios, logs, flags])
+
+
+def cache_key(data: pd.DataFrame, missing: pd.DataFrame, spec: dict) -> str:
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"version": FEATURE_SPEC_VERSION, "spec": spec}, sort_keys=True).encode())
+    digest.update(np.ascontiguousarray(data[FEATURE_COLUMNS].to_numpy(dtype=FEATURE_DTYPE)).tobytes())
+    digest.update(np.ascontiguousarray(missing[spec["missing_flags"]].to_numpy(dtype=bool)).tobytes())
+    return digest.hexdigest()
+
+
+def prune_cache(cache_dir: str, max_entries: int) -> None:
+    # Keep only the most recently used matrices
+    entries = sorted(
+        (os.path.join(cache_dir, f) for f in os.listdir(cache_dir) if f.endswith(".npy")),
+        key=os.path.getmtime,
+        reverse=True,
+    )
+    for path in entries[max_entries:]:
+        os.remove(path)
+
+
+def build_features(data: pd.DataFrame, missing: pd.DataFrame, spec: dict, cache_dir: str = None,
+                   max_entries: int = 8) -> pd.DataFrame:
+    """Feature frame for ``data``.
+
+    With ``cache_dir`` the matrix is reused for identical input values,
+    missingness, spec and FEATURE_SPEC_VERSION; only the ``max_entries``
+    most recently used matrices are kept.
+    """
+    try:
+        matrix = None
+        if cache_dir:
+            cache_path = os.path.join(cache_dir, f"{cache_key(data, missing, spec)}.npy")
+            if os.path.exists(cache_path):
+                matrix = np.load(cache_path)
+                os.utime(cache_path)
+        if matrix is None:
+            matrix = compute_features(data, missing, spec)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+                np.save(cache_path, matrix)
+                prune_cache(cache_dir, max_entries)
+
+        features = pd.DataFrame(matrix, columns=feature_names(spec), index=data.index)
+        if TARGET_COLUMN in data:
+            features[TARGET_COLUMN] = data[TARGET_COLUMN]
+        return features
+    except Exception as e:
+        raise Exception(f"Error building features: {e}")
+
+
+def save_data(df: pd.DataFrame, filepath: str) -> None:
+    try:
+        df.to_csv(filepath, index=False)
+    except Exception as e:
+        raise Exception(f"Error saving data to {filepath}: {e}")
+
+
+def main():
+    try:
+        params_path = "params.yaml"
+        validated_data_path = "./data/interim"
+        processed_data_path = "./data/processed"
+        features_path = "./data/features"
+
+        spec = load_params(params_path)
+        cache_dir = spec.pop("cache_dir", None)
+        max_entries = spec.pop("cache_max_entries", 8)
+        os.makedirs(features_path, exist_ok=True)
+
+        for split in ("train", "test"):
+            # Missingness has to come from the data before imputation
+            missing = load_data(os.path.join(validated_data_path, f"{split}.csv")).isna()
+            processed = load_data(os.path.join(processed_data_path, f"{split}_processed.csv"))
+            features = build_features(processed, missing, spec, cache_dir, max_entries)
+            save_data(features, os.path.join(features_path, f"{split}_features.csv"))
+    except Exception as e:
+        raise Exception(f"An error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import json
+import os
+import pickle
+import numpy as np
+import pandas as pd
+import yaml
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import brier_score_loss
+
+from src.data.schema import TARGET_COLUMN, ENGINEERED_DTYPES
+from src.model.resources import ResourceBudget, record_layout
+
+
+def load_params(params_path: str) -> dict:
+    try:
+        with open(params_path, "r") as file:
+            params = yaml.safe_load(file)
+        return params["calibration"]
+    except Exception as e:
+        raise Exception(f"Error loading parameters from {params_path}: {e}")
+
+
+def load_data(filepath: str) -> pd.DataFrame:
+    try:
+        return pd.read_csv(filepath, dtype=ENGINEERED_DTYPES)
+    except Exception as e:
+        raise Exception(f"Error loading data from {filepath}: {e}")
+
+
+def load_model(filepath: str):
+    try:
+        with open(filepath, "rb") as file:
+            return pickle.load(file)
+    except Exception as e:
+        raise Exception(f"Error loading model from {filepath}: {e}")
+
+
+class CalibrationTable:
+    """Calibrated probability for a raw forest score, precomputed on a grid.
+
+    The table holds the calibrator evaluated at ``size`` evenly spaced scores
+    in [0, 1], so applying it is a single index computation per batch and no
+    calibration model runs at serving time.
+    """
+    def __init__(self, table: np.ndarray, method: str):
+        self.table = np.asarray(table, dtype=np.float32)
+        self.method = method
+
+    @classmethod
+    def fit(cls, scores: np.ndarray, y: np.ndarray, method: str = "isotonic", size: int = 1001) -> "CalibrationTable":
+        try:
+            grid = np.linspace(0, 1, size)
+            if method == "isotonic":
+                calibrator = IsotonicRegression(y_min=0, y_max=1, out_of_bounds="clip").fit(scores, y)
+                table = calibrator.predict(grid)
+            elif method == "sigmoid":
+                # Platt scaling: logistic regression on the raw score
+                calibrator = LogisticRegression().fit(scores.reshape(-1, 1), y)
+                table = calibrator.predict_proba(grid.reshape(-1, 1))[:, 1]
+            else:
+                raise ValueError(f"Unknown calibration method '{method}'")
+            return cls(table, method)
+        except Exception as e:
+            raise Exception(f"Error fitting calibration: {e}")
+
+    def apply(self, scores: np.ndarray) -> np.ndarray:
+        index = np.rint(np.clip(scores, 0, 1) * (len(self.table) - 1)).astype(np.intp)
+        return self.table[index]
+
+    def predict_proba(self, model, X) -> np.ndarray:
+        """Calibrated probability of the positive class."""
+        return self.apply(model.predict_proba(X)[:, 1])
+
+    def save(self, filepath: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, "w") as file:
+                json.dump({"method": self.method, "table": self.table.tolist()}, file)
+        except Exception as e:
+            raise Exception(f"Error saving calibration table to {filepath}: {e}")
+
+    @classmethod
+    def load(cls, filepath: str) -> "CalibrationTable":
+        try:
+            with open(filepath, "r") as file:
+                data = json.load(file)
+            return cls(np.array(data["table"]), data["method"])
+        except Exception as e:
+            raise Exception(f"Error loading calibration table from {filepath}: {e}")
+
+
+def held_out_scores(model, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Out-of-bag scores: each training row is scored only by trees that never saw it
+    if not hasattr(model, "oob_decision_function_"):
+        raise ValueError("Model has no out-of-bag scores, train it with oob_score=True")
+    scores = model.oob_decision_function_[:, 1]
+    valid = ~np.isnan(scores)
+    return scores[valid], y[valid]
+
+
+def main():
+    try:
+        params_path = "params.yaml"
+        train_data_path = "./data/features/train_features.csv"
+        test_data_path = "./data/features/test_features.csv"
+        model_path = "models/model.pkl"
+        table_path = "models/calibration.json"
+        report_path = "reports/calibration.json"
+
+        params = load_params(params_path)
+        model = load_model(model_path)
+        y_train = pd.read_csv(train_data_path, usecols=[TARGET_COLUMN])[TARGET_COLUMN].to_numpy()
+
+        scores, y = held_out_scores(model, y_train)
+        table = CalibrationTable.fit(scores, y, params["method"], params["table_size"])
+        table.save(table_path)
+
+        # Brier score on the untouched test split, before and after calibration
+        test_data = load_data(test_data_path)
+        X_test, y_test = test_data.drop(columns=[TARGET_COLUMN]), test_data[TARGET_COLUMN]
+        with ResourceBudget.from_params(params_path).limit("batch_scoring") as layout:
+            record_layout(layout, "reports/resources/calibration.json")
+            model.n_jobs = layout["n_jobs"]
+            raw = model.predict_proba(X_test)[:, 1]
+        report = {
+            "method": params["method"],
+            "brier_raw": float(brier_score_loss(y_test, raw)),
+            "brier_calibrated": float(brier_score_loss(y_test, table.apply(raw))),
+        }
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"Calibration ({params['method']}): Brier {report['brier_raw']:.4f} -> {report['brier_calibrated']:.4f}")
+    except Exception as e:
+        raise Exception(f"An error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
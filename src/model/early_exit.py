@@ -0,0 +1,141 @@
+import json
+import os
+import pickle
+import time
+import numpy as np
+import pandas as pd
+import yaml
+
+from src.data.schema import TARGET_COLUMN, ENGINEERED_DTYPES
+
+
+def load_params(params_path: str) -> dict:
+    try:
+        with open(params_path, "r") as file:
+            params = yaml.safe_load(file)
+        return params["early_exit"]
+    except Exception as e:
+        raise Exception(f"Error loading parameters from {params_path}: {e}")
+
+
+def load_model(filepath: str):
+    try:
+        with open(filepath, "rb") as file:
+            return pickle.load(file)
+    except Exception as e:
+        raise Exception(f"Error loading model from {filepath}: {e}")
+
+
+class EarlyExitForest:
+    """Evaluates a fitted random forest in blocks of trees and stops early
+    for rows whose outcome is already settled.
+
+    After k of T trees a row's mean positive score is compared with the 0.5
+    decision threshold. Trees are treated as a sample drawn without
+    replacement from the forest, so by Serfling's inequality the full-forest
+    mean lies within
+
+        eps(k) = sqrt(ln(2 * m / delta) * (1 - (k - 1) / T) / (2 * k))
+
+    of the partial mean with probability at least 1 - delta / m. Rows with
+    |mean - 0.5| > eps(k) are decided and skipped by later blocks. With m
+    the number of checks a row can go through, a union bound gives each row
+    the full forest's decision with probability at least 1 - delta.
+    """
+    def __init__(self, model, block_size: int = 50, delta: float = 1e-3, min_trees: int = 100):
+        self.model = model
+        self.block_size = block_size
+        self.delta = delta
+        self.min_trees = min_trees
+        self.trees_used = None
+
+    def n_checks(self) -> int:
+        n_trees = len(self.model.estimators_)
+        checks = range(self.block_size, n_trees, self.block_size)
+        return max(sum(1 for k in checks if k >= self.min_trees), 1)
+
+    def bound(self, k: int) -> float:
+        # delta is shared out over every check a row can go through
+        n_trees = len(self.model.estimators_)
+        return np.sqrt(np.log(2 * self.n_checks() / self.delta) * (1 - (k - 1) / n_trees) / (2 * k))
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Positive-class score per row; ``self.trees_used`` holds trees evaluated per row."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        estimators = self.model.estimators_
+        n_rows, n_trees = len(X), len(estimators)
+
+        totals = np.zeros(n_rows)
+        trees_used = np.zeros(n_rows, dtype=np.int64)
+        active = np.arange(n_rows)
+
+        for start in range(0, n_trees, self.block_size):
+            block = estimators[start:start + self.block_size]
+            X_active = X[active]
+            for tree in block:
+                totals[active] += tree.predict_proba(X_active, check_input=False)[:, 1]
+            k = start + len(block)
+            trees_used[active] = k
+
+            if k >= self.min_trees and k < n_trees:
+                margin = np.abs(totals[active] / k - 0.5)
+                active = active[margin <= self.bound(k)]
+                if len(active) == 0:
+                    break
+
+        self.trees_used = trees_used
+        return totals / trees_used
+
+    def predict(self, X) -> np.ndarray:
+        # Same tie-break as the forest: a score of exactly 0.5 goes to classes_[0]
+        return self.model.classes_[(self.predict_proba(X) > 0.5).astype(int)]
+
+
+def compare_with_full(model, X, block_size: int, delta: float, min_trees: int) -> dict:
+    try:
+        model.n_jobs = 1  # compare like for like, single-threaded
+        start = time.perf_counter()
+        full = model.predict(X)
+        full_seconds = time.perf_counter() - start
+
+        early_forest = EarlyExitForest(model, block_size, delta, min_trees)
+        start = time.perf_counter()
+        early = early_forest.predict(X)
+        early_seconds = time.perf_counter() - start
+
+        return {
+            "rows": len(X),
+            "n_estimators": len(model.estimators_),
+            "avg_trees_per_row": float(early_forest.trees_used.mean()),
+            "full_seconds": full_seconds,
+            "early_exit_seconds": early_seconds,
+            "speedup": full_seconds / early_seconds,
+            "disagreement_rate": float(np.mean(full != early)),
+        }
+    except Exception as e:
+        raise Exception(f"Error comparing early-exit inference: {e}")
+
+
+def main():
+    try:
+        params_path = "params.yaml"
+        model_path = "models/model.pkl"
+        test_data_path = "./data/features/test_features.csv"
+        report_path = "reports/early_exit.json"
+
+        params = load_params(params_path)
+        model = load_model(model_path)
+        test_data = pd.read_csv(test_data_path, dtype=ENGINEERED_DTYPES)
+        X_test = test_data.drop(columns=[TARGET_COLUMN])
+
+        report = compare_with_full(model, X_test, params["block_size"], params["delta"], params["min_trees"])
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, "w") as file:
+            json.dump(report, file, indent=4)
+        print(json.dumps(report, indent=4))
+    except Exception as e:
+        raise Exception(f"An error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,24 @@
+import numpy as np
 import pandas as pd
 import yaml
 import pickle
 import os
 from sklearn.ensemble import RandomForestClassifier
 
-def load_params(params_path: str) -> int:
+from src.data.schema import ENGINEERED_DTYPES
+from src.model.resources import ResourceBudget, record_layout
+
+def load_params(params_path: str) -> dict:
     try:
         with open(params_path, "r") as file:
             params = yaml.safe_load(file)
-        return params["model_building"]["n_estimators"]
+        return params["model_building"]
     except Exception as e:
         raise Exception(f"Error loading parameters from {params_path}: {e}")
 
 def load_data(data_path: str) -> pd.DataFrame:
     try:
-        return pd.read_csv(data_path)
+        return pd.read_csv(data_path, dtype=ENGINEERED_DTYPES)
     except Exception as e:
         raise Exception(f"Error loading data from {data_path}: {e}")
 
@@ -26,14 +30,77 @@ def prepare_data(data: pd.DataFrame) -> tuple[pd.DataFrame, pd.Series]:
     except Exception as e:
         raise Exception(f"Error preparing data: {e}")
 
-def train_model(X: pd.DataFrame, y: pd.Series, n_estimators: int) -> RandomForestClassifier:
+def train_model(X: pd.DataFrame, y: pd.Series, n_estimators: int, n_jobs: int = None) -> RandomForestClassifier:
     try:
-        clf = RandomForestClassifier(n_estimators=n_estimators)
+        # Out-of-bag scores are kept as held-out data for the calibration stage
+        clf = RandomForestClassifier(n_estimators=n_estimators, oob_score=True, n_jobs=n_jobs)
         clf.fit(X, y)
         return clf
     except Exception as e:
         raise Exception(f"Error training model: {e}")
 
+def count_rows(data_path: str) -> int:
+    try:
+        with open(data_path, "rb") as file:
+            return sum(1 for _ in file) - 1  # minus header
+    except Exception as e:
+        raise Exception(f"Error counting rows in {data_path}: {e}")
+
+def merge_forests(forests: list[RandomForestClassifier]) -> RandomForestClassifier:
+    # Trees from every chunk go into one forest, so the result predicts and
+    # pickles like a normally trained model
+    try:
+        merged = forests[0]
+        for forest in forests[1:]:
+            if not np.array_equal(forest.classes_, merged.classes_):
+                raise ValueError(f"Chunk has classes {forest.classes_}, expected {merged.classes_}; "
+                                 "use larger or shuffled chunks")
+        merged.estimators_ = [tree for forest in forests for tree in forest.estimators_]
+        merged.n_estimators = len(merged.estimators_)
+        # Each row keeps the out-of-bag score of its own chunk's forest
+        merged.oob_decision_function_ = np.vstack([f.oob_decision_function_ for f in forests])
+        merged.oob_score_ = float(np.average([f.oob_score_ for f in forests],
+                                             weights=[len(f.oob_decision_function_) for f in forests]))
+        return merged
+    except Exception as e:
+        raise Exception(f"Error merging forests: {e}")
+
+def train_model_chunked(data_path: str, n_estimators: int, chunk_size: int,
+                        n_jobs: int = None) -> RandomForestClassifier:
+    """Fit one forest per chunk of the CSV and merge them.
+
+    Only one chunk is held in memory at a time, so peak memory depends on
+    chunk_size rather than on the size of the file. A final chunk shorter
+    than half of chunk_size is folded into the one before it, and each chunk
+    gets trees in proportion to its rows, n_estimators in total.
+    """
+    try:
+        n_rows = count_rows(data_path)
+        forests, done = [], 0
+
+        def fit(chunk: pd.DataFrame) -> RandomForestClassifier:
+            nonlocal done
+            n_trees = round(n_estimators * (done + len(chunk)) / n_rows) - round(n_estimators * done / n_rows)
+            done += len(chunk)
+            X, y = prepare_data(chunk)
+            return train_model(X, y, max(n_trees, 1), n_jobs)
+
+        pending = None
+        for chunk in pd.read_csv(data_path, dtype=ENGINEERED_DTYPES, chunksize=chunk_size):
+            # Only the last chunk can be short
+            if pending is not None and len(chunk) < chunk_size / 2:
+                pending = pd.concat([pending, chunk])
+                continue
+            if pending is not None:
+                forests.append(fit(pending))
+            pending = chunk
+        if pending is None:
+            raise ValueError(f"No rows in {data_path}")
+        forests.append(fit(pending))
+        return merge_forests(forests)
+    except Exception as e:
+        raise Exception(f"Error training model out of core: {e}")
+
 def save_model(model: RandomForestClassifier, model_name: str) -> None:
     try:
         # Create the directory if it doesn't exist
@@ -47,14 +114,20 @@ def save_model(model: RandomForestClassifier, model_name: str) -> None:
 def main():
     try:
         params_path = "params.yaml"
-        data_path = "./data/processed/train_processed.csv"
+        data_path = "./data/features/train_features.csv"
         model_name = "models/model.pkl"
 
-        n_estimators = load_params(params_path)
-        train_data = load_data(data_path)
-        X_train, y_train = prepare_data(train_data)
+        params = load_params(params_path)
+        n_estimators = params["n_estimators"]
 
-        model = train_model(X_train, y_train, n_estimators)
+        with ResourceBudget.from_params(params_path).limit("training") as layout:
+            record_layout(layout, "reports/resources/model_building.json")
+            if params.get("chunk_size"):
+                model = train_model_chunked(data_path, n_estimators, params["chunk_size"], layout["n_jobs"])
+            else:
+                train_data = load_data(data_path)
+                X_train, y_train = prepare_data(train_data)
+                model = train_model(X_train, y_train, n_estimators, layout["n_jobs"])
         save_model(model, model_name)
         print("Model trained and saved successfully!")
     except Exception as e:
@@ -4,69 +4,22 @@ import pickle
 import json
 import mlflow
 import yaml
-import seaborn as sns
-import matplotlib.pyplot as plt
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix
 from mlflow import log_metric, log_param, log_artifact
 import mlflow.sklearn
-import dagshub
 import mlflow
 import os
 from mlflow.models import infer_signature
 
-# Try to load .env file for local development
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # This loads .env file if it exists
-except ImportError:
-    pass  # dotenv not installed, continue without it
-
-# Initialize DagsHub for experiment tracking
-# THIS IS DUE TO GITHUB ACTION CAN ACCESS - LOCALLY WILL NOT NEED
-dagshub_token = os.getenv("DAGSHUB_USER_TOKEN") or os.getenv("DAGSHUB_TOKEN")
-if dagshub_token:
-    print("DAGSHUB_TOKEN is set")
-else:
-    print("DAGSHUB_TOKEN is not set")
-# Try to use cached token if environment variable is not set
-if not dagshub_token:
-    try:
-        # This will use the token from dagshub login command or add_app_token()
-        dagshub.auth.add_app_token(dagshub_token) if dagshub_token else None
-    except:
-        pass
-
-if not dagshub_token:
-    raise ValueError("DAGSHUB_USER_TOKEN or DAGSHUB_TOKEN environment variable is not set")
-# Set environment variables for MLflow authentication
-os.environ["MLFLOW_TRACKING_TOKEN"] = dagshub_token
-os.environ["MLFLOW_TRACKING_PASSWORD"] = dagshub_token
-# Configure DagsHub MLflow tracking
-dagshub_url = "https://dagshub.com"
-repo_owner = "trong1234ar"
-repo_name = "water-potability"
-# Initialize DagsHub connection
-dagshub.init(repo_owner=repo_owner, repo_name=repo_name, mlflow=True)
-mlflow.set_tracking_uri(f"{dagshub_url}/{repo_owner}/{repo_name}.mlflow")
-# Set experiment (this should work now with proper authentication)
-try:
-    mlflow.set_experiment("DVC_Pipeline")
-except Exception as e:
-    print(f"Warning: Could not set experiment 'DVC_Pipeline': {e}")
-    # Create experiment if it doesn't exist
-    try:
-        mlflow.create_experiment("DVC_Pipeline")
-        mlflow.set_experiment("DVC_Pipeline")
-    except Exception as create_error:
-        print(f"Error creating experiment: {create_error}")
-        # Use default experiment as fallback
-        print("Using default experiment")
-# Set MLflow tracking URI
+from src.data.schema import ENGINEERED_DTYPES
+from src.model.tracking import init_tracking
+from src.model.resources import ResourceBudget, record_layout
+from src.visualization.visualize import plot_confusion_matrix, plots_enabled
 
 
 def load_data(filepath: str) -> pd.DataFrame:
     try:
-        return pd.read_csv(filepath)
+        return pd.read_csv(filepath, dtype=ENGINEERED_DTYPES)
     except Exception as e:
         raise Exception(f"Error loading data from {filepath}: {e}")
 
@@ -110,17 +63,13 @@ def evaluation_model(model, X_test: pd.DataFrame, y_test: pd.Series, model_name:
         mlflow.log_metric("f1_score", f1)
         
         # Confusion matrix
-        cm = confusion_matrix(y_test, y_pred)
-        plt.figure(figsize=(5, 5))
-        sns.heatmap(cm, annot=True, fmt='d', cmap='Blues')
-        plt.xlabel("Predicted")
-        plt.ylabel("Actual")
-        plt.title(f"Confusion Matrix for {model_name}")
-        cm_path = f"confusion_matrix_{model_name.replace(' ', '_')}.png"
-        plt.savefig(cm_path)
-        
-        # Log confusion matrix artifact
-        mlflow.log_artifact(cm_path)
+        if plots_enabled(params.get("visualization", {})):
+            cm = confusion_matrix(y_test, y_pred)
+            cm_path = f"confusion_matrix_{model_name.replace(' ', '_')}.png"
+            plot_confusion_matrix(cm, f"Confusion Matrix for {model_name}", cm_path)
+
+            # Log confusion matrix artifact
+            mlflow.log_artifact(cm_path)
         
         # Log the model
         #mlflow.sklearn.log_model(model, model_name.replace(' ', '_'))
@@ -147,7 +96,7 @@ def save_metrics(metrics: dict, metrics_path: str) -> None:
 
 def main():
     try:
-        test_data_path = "./data/processed/test_processed.csv"
+        test_data_path = "./data/features/test_features.csv"
         model_path = "models/model.pkl"
         metrics_path = "reports/metrics.json"
         model_name = "Best Model"
@@ -156,10 +105,13 @@ def main():
         X_test, y_test = prepare_data(test_data)
         model = load_model(model_path)
 
+        init_tracking()
         # Start MLflow run
         mlflow.autolog()
 
-        with mlflow.start_run() as run:
+        with mlflow.start_run() as run, ResourceBudget.from_params().limit("batch_scoring") as layout:
+            record_layout(layout, "reports/resources/model_eval.json")
+            model.n_jobs = layout["n_jobs"]
             metrics = evaluation_model(model, X_test, y_test, model_name)
             save_metrics(metrics, metrics_path)
 
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mlflow
+from mlflow.exceptions import MlflowException
+from mlflow.tracking import MlflowClient
+
+# Errors that will not go away by asking again
+NON_RETRYABLE_ERRORS = {
+    "RESOURCE_ALREADY_EXISTS",
+    "RESOURCE_DOES_NOT_EXIST",
+    "INVALID_PARAMETER_VALUE",
+}
+HASH_TAG = "content_hash"
+
+
+def file_hash(filepath: str, block_size: int = 1 << 20) -> str:
+    try:
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as file:
+            for block in iter(lambda: file.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    except Exception as e:
+        raise Exception(f"Error hashing {filepath}: {e}")
+
+
+class RegistryClient:
+    """MLflow model registry client for the pipeline.
+
+    Wraps MlflowClient with a local TTL cache of model / version metadata,
+    retries with exponential backoff on transient errors, and runs
+    independent calls (model creation, hash lookup, aliases) on a thread
+    pool. Versions are tagged with the content hash of the model file, so
+    registering the same artifact twice returns the existing version.
+    """
+    def __init__(self, client: MlflowClient = None, cache_path: str = None, cache_ttl: float = 300,
+                 max_retries: int = 3, backoff_seconds: float = 0.5, max_workers: int = 4):
+        self.client = client or MlflowClient()
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+        # Cache entries are scoped to the registry they came from
+        self._namespace = mlflow.get_registry_uri()
+
+    # --- cache
+    def _load_cache(self) -> dict:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r") as file:
+                return json.load(file)
+        except Exception as e:
+            print(f"Warning: ignoring unreadable registry cache {self.cache_path}: {e}")
+            return {}
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with self._lock:
+                with open(self.cache_path, "w") as file:
+                    json.dump(self._cache, file, indent=4)
+        except Exception as e:
+            print(f"Warning: could not save registry cache to {self.cache_path}: {e}")
+
+    def _cache_get(self, key: str):
+        with self._lock:
+            entry = self._cache.get(f"{self._namespace}|{key}")
+        if entry and time.time() - entry["time"] < self.cache_ttl:
+            return entry["value"]
+        return None
+
+    def _cache_set(self, key: str, value) -> None:
+        with self._lock:
+            self._cache[f"{self._namespace}|{key}"] = {"time": time.time(), "value": value}
+
+    # --- retries
+    def _call(self, fn, *args, _before_retry=None, **kwargs):
+        """Call ``fn`` with retries.
+
+        ``_before_retry`` guards calls that are not idempotent: it runs before
+        every retry and, if it returns something, that is returned instead of
+        calling ``fn`` again.
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt and _before_retry is not None:
+                result = _before_retry()
+                if result is not None:
+                    return result
+            try:
+                return fn(*args, **kwargs)
+            except MlflowException as e:
+                if e.error_code in NON_RETRYABLE_ERRORS or attempt == self.max_retries:
+                    raise
+                error = e
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                error = e
+            delay = self.backoff_seconds * 2 ** attempt
+            print(f"Registry call {fn.__name__} failed ({error}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+    # --- registry operations
+    def ensure_registered_model(self, name: str) -> None:
+        key = f"model:{name}"
+        if self._cache_get(key):
+            return
+        try:
+            self._call(self.client.create_registered_model, name)
+        except MlflowException as e:
+            if e.error_code != "RESOURCE_ALREADY_EXISTS":
+                raise
+        self._cache_set(key, True)
+
+    def find_version(self, name: str, content_hash: str):
+        key = f"version:{name}:{content_hash}"
+        cached = self._cache_get(key)
+        if cached:
+            return cached
+        versions = self._call(
+            self.client.search_model_versions,
+            f"name = '{name}' and tags.{HASH_TAG} = '{content_hash}'",
+        )
+        if not versions:
+            return None
+        mv = min(versions, key=lambda v: int(v.version))
+        info = {"version": str(mv.version), "run_id": mv.run_id}
+        self._cache_set(key, info)
+        return info
+
+    def register(self, name: str, source: str, run_id: str, content_hash: str,
+                 aliases: tuple = ("staging",)) -> tuple[dict, bool]:
+        """Register a model version and point aliases at it.
+
+        Returns the version info and whether a new version was created.
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                created = pool.submit(self.ensure_registered_model, name)
+                existing = pool.submit(self.find_version, name, content_hash)
+                created.result()
+                existing = existing.result()
+
+            if existing:
+                return existing, False
+
+            # A create that timed out may still have gone through on the
+            # server, so look for the hash again before retrying it
+            mv = self._call(
+                self.client.create_model_version,
+                name=name,
+                source=source,
+                run_id=run_id,
+                tags={HASH_TAG: content_hash},
+                _before_retry=lambda: self.find_version(name, content_hash),
+            )
+            if isinstance(mv, dict):
+                info = mv  # our earlier attempt did create it
+            else:
+                info = {"version": str(mv.version), "run_id": mv.run_id}
+                self._cache_set(f"version:{name}:{content_hash}", info)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [
+                    pool.submit(self._call, self.client.set_registered_model_alias,
+                                name=name, alias=alias, version=info["version"])
+                    for alias in aliases
+                ]
+                for future in futures:
+                    future.result()
+            return info, True
+        finally:
+            self._save_cache()
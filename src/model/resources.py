@@ -0,0 +1,91 @@
+import json
+import os
+from contextlib import contextmanager
+
+import yaml
+from joblib import parallel_backend
+from threadpoolctl import threadpool_limits
+
+# joblib backend behind each backend setting
+JOBLIB_BACKENDS = {"threads": "threading", "processes": "loky"}
+
+# Environment variables read by BLAS/OpenMP runtimes when a worker process starts
+BLAS_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "BLIS_NUM_THREADS")
+
+
+def available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def init_worker(blas_threads: int) -> None:
+    """Process pool initializer: cap BLAS threads inside the worker."""
+    for var in BLAS_ENV_VARS:
+        os.environ[var] = str(blas_threads)
+    threadpool_limits(limits=blas_threads)
+
+
+class ResourceBudget:
+    """Splits the machine's cores between parallel workers and BLAS threads.
+
+    Every parallel entry point (training, batch scoring, serving, ...) asks
+    for its layout here instead of picking n_jobs itself, so nested joblib
+    workers and BLAS thread pools never add up to more than the budget.
+    Task settings come from the ``resources`` section of params.yaml:
+
+    - ``backend``: "threads" (joblib threading; forest fit/predict releases
+      the GIL) or "processes" (joblib loky workers, each capped to its share
+      of BLAS threads); ``limit`` makes it the active joblib backend
+    - ``workers``: parallel workers wanted, null for as many as fit
+    """
+    def __init__(self, cores: int = None, tasks: dict = None):
+        self.cores = min(cores or available_cores(), available_cores())
+        self.tasks = tasks or {}
+
+    @classmethod
+    def from_params(cls, params_path: str = "params.yaml") -> "ResourceBudget":
+        try:
+            with open(params_path, "r") as file:
+                params = yaml.safe_load(file).get("resources", {})
+            return cls(params.get("cores"), params.get("tasks"))
+        except Exception as e:
+            raise Exception(f"Error loading resource budget from {params_path}: {e}")
+
+    def layout(self, task: str) -> dict:
+        settings = self.tasks.get(task, {})
+        backend = settings.get("backend", "threads")
+        if backend not in JOBLIB_BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' for {task}, expected one of {list(JOBLIB_BACKENDS)}")
+        workers = max(min(settings.get("workers") or self.cores, self.cores), 1)
+        # Whatever the workers leave over is shared out as BLAS threads
+        blas_threads = max(self.cores // workers, 1)
+        return {
+            "task": task,
+            "cores": self.cores,
+            "backend": backend,
+            "n_jobs": workers,
+            "blas_threads": blas_threads,
+        }
+
+    @contextmanager
+    def limit(self, task: str):
+        """Run ``task`` under its joblib backend with BLAS threads capped; yields the layout."""
+        layout = self.layout(task)
+        if layout["backend"] == "processes":
+            backend = parallel_backend("loky", n_jobs=layout["n_jobs"], inner_max_num_threads=layout["blas_threads"])
+        else:
+            backend = parallel_backend("threading", n_jobs=layout["n_jobs"])
+        with threadpool_limits(limits=layout["blas_threads"], user_api="blas"), backend:
+            yield layout
+
+
+def record_layout(layout: dict, report_path: str) -> None:
+    """Write the chosen layout to the calling stage's own report."""
+    try:
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        with open(report_path, "w") as file:
+            json.dump(layout, file, indent=4)
+    except Exception as e:
+        raise Exception(f"Error recording resource layout to {report_path}: {e}")
@@ -0,0 +1,207 @@
+import json
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+import numpy as np
+import pandas as pd
+import yaml
+
+from src.data.schema import TARGET_COLUMN, ENGINEERED_DTYPES
+from src.model.calibration import CalibrationTable
+from src.model.resources import ResourceBudget, init_worker, record_layout
+
+# Model used by pool workers. Set in the parent right before the pool is
+# forked, so every worker shares the already loaded, warmed up copy.
+_MODEL = None
+
+
+def load_model(filepath: str):
+    try:
+        with open(filepath, "rb") as file:
+            return pickle.load(file)
+    except Exception as e:
+        raise Exception(f"Error loading model from {filepath}: {e}")
+
+
+def load_params(params_path: str) -> dict:
+    try:
+        with open(params_path, "r") as file:
+            params = yaml.safe_load(file)
+        return params["serving"]
+    except Exception as e:
+        raise Exception(f"Error loading parameters from {params_path}: {e}")
+
+
+def synthetic_batch(model, n_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    columns = list(model.feature_names_in_)
+    return pd.DataFrame(rng.normal(size=(n_rows, len(columns))).astype(np.float32), columns=columns)
+
+
+def validate_model(model) -> None:
+    for attr in ("predict_proba", "feature_names_in_", "estimators_"):
+        if not hasattr(model, attr):
+            raise ValueError(f"Model is missing '{attr}', not a fitted forest")
+    proba = model.predict_proba(synthetic_batch(model, 8))
+    if proba.shape != (8, len(model.classes_)) or not np.allclose(proba.sum(axis=1), 1):
+        raise ValueError(f"Model returned invalid probabilities with shape {proba.shape}")
+
+
+def warm_up(model, batch_sizes: list, rounds: int) -> None:
+    # Touch every tree's arrays so their pages are resident before forking,
+    # then run real batches to warm the prediction code paths
+    for tree in model.estimators_:
+        tree.tree_.threshold.sum()
+        tree.tree_.value.sum()
+    for i in range(rounds):
+        for n_rows in batch_sizes:
+            model.predict_proba(synthetic_batch(model, n_rows, seed=i))
+
+
+def _init_worker(blas_threads: int, model_path: str = None) -> None:
+    global _MODEL
+    init_worker(blas_threads)
+    if model_path:
+        # Without fork there is nothing to share, each worker loads its own copy
+        _MODEL = load_model(model_path)
+
+
+def _predict_proba(X: pd.DataFrame) -> np.ndarray:
+    return _MODEL.predict_proba(X)[:, 1]
+
+
+class ModelServer:
+    """Preloaded, warmed up model behind a pool of worker processes.
+
+    The parent loads, validates and warms up the model, then forks the
+    workers so they start ready and share its memory copy-on-write.
+    ``swap`` brings up a new version the same way and only then retires the
+    old pool, letting requests already sent to it finish.
+    """
+    def __init__(self, budget: ResourceBudget, warmup_batch_sizes: list = (1, 32, 256),
+                 warmup_rounds: int = 2, calibration_path: str = None):
+        self.layout = budget.layout("serving")
+        if self.layout["backend"] != "processes":
+            raise ValueError(f"Serving runs in worker processes, got backend '{self.layout['backend']}'")
+        self.warmup_batch_sizes = list(warmup_batch_sizes)
+        self.warmup_rounds = warmup_rounds
+        self.calibration = CalibrationTable.load(calibration_path) if calibration_path else None
+        self.timings = {}
+        self.model_path = None
+        self._pool = None
+        self._lock = threading.Lock()
+        # Serializes start / swap so two of them never retire the same pool
+        self._swap_lock = threading.RLock()
+
+    def _prepare(self, model_path: str) -> tuple:
+        timings = {}
+        start = time.perf_counter()
+        model = load_model(model_path)
+        model.n_jobs = 1  # parallelism comes from the worker processes
+        timings["load_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validate_model(model)
+        timings["validate_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm_up(model, self.warmup_batch_sizes, self.warmup_rounds)
+        timings["warmup_seconds"] = time.perf_counter() - start
+        return model, timings
+
+    def _start_pool(self, model, model_path: str):
+        global _MODEL
+        start = time.perf_counter()
+        methods = multiprocessing.get_all_start_methods()
+        if "fork" in methods:
+            _MODEL = model
+            context, initargs = multiprocessing.get_context("fork"), (self.layout["blas_threads"],)
+        else:
+            context, initargs = multiprocessing.get_context(), (self.layout["blas_threads"], model_path)
+        pool = context.Pool(self.layout["n_jobs"], initializer=_init_worker, initargs=initargs)
+        # Round trip through every worker so the pool is really up
+        pool.map(_predict_proba, [synthetic_batch(model, 1)] * self.layout["n_jobs"], chunksize=1)
+        return pool, time.perf_counter() - start
+
+    def start(self, model_path: str) -> dict:
+        try:
+            with self._swap_lock:
+                started = time.perf_counter()
+                model, timings = self._prepare(model_path)
+                pool, timings["pool_seconds"] = self._start_pool(model, model_path)
+                timings["time_to_ready_seconds"] = time.perf_counter() - started
+                with self._lock:
+                    self._pool, self.model_path, self.timings = pool, model_path, timings
+                return timings
+        except Exception as e:
+            raise Exception(f"Error starting model server for {model_path}: {e}")
+
+    def swap(self, model_path: str) -> dict:
+        """Serve a new model version without dropping in-flight requests."""
+        with self._swap_lock:
+            with self._lock:
+                old_pool = self._pool
+            timings = self.start(model_path)
+            if old_pool is not None:
+                # close() lets queued tasks finish; join in the background
+                old_pool.close()
+                threading.Thread(target=old_pool.join, daemon=True).start()
+            return timings
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        batches = np.array_split(np.arange(len(X)), min(self.layout["n_jobs"], max(len(X), 1)))
+        batches = [X.iloc[rows] for rows in batches]
+        while True:
+            with self._lock:
+                pool = self._pool
+            if pool is None:
+                raise RuntimeError("Model server is not started")
+            try:
+                scores = np.concatenate(pool.map(_predict_proba, batches))
+                break
+            except ValueError:
+                # Pool was retired by a swap between lookup and submit, use the new one
+                if pool is self._pool:
+                    raise
+        return self.calibration.apply(scores) if self.calibration else scores
+
+    def stop(self) -> None:
+        with self._swap_lock, self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def main():
+    try:
+        params_path = "params.yaml"
+        model_path = "models/model.pkl"
+        calibration_path = "models/calibration.json"
+        data_path = "./data/features/test_features.csv"
+
+        params = load_params(params_path)
+        budget = ResourceBudget.from_params(params_path)
+        server = ModelServer(
+            budget,
+            warmup_batch_sizes=params["warmup_batch_sizes"],
+            warmup_rounds=params["warmup_rounds"],
+            calibration_path=calibration_path if os.path.exists(calibration_path) else None,
+        )
+        timings = server.start(model_path)
+        record_layout({**server.layout, **timings}, "reports/resources/serving.json")
+        print(json.dumps(timings, indent=4))
+
+        X = pd.read_csv(data_path, dtype=ENGINEERED_DTYPES).drop(columns=[TARGET_COLUMN])
+        start = time.perf_counter()
+        server.predict_proba(X)
+        print(f"Scored {len(X)} rows in {time.perf_counter() - start:.3f}s")
+        server.stop()
+    except Exception as e:
+        raise Exception(f"An error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
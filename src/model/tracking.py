@@ -0,0 +1,50 @@
+import os
+import mlflow
+
+# Try to load .env file for local development
+try:
+    from dotenv import load_dotenv
+    load_dotenv()  # This loads .env file if it exists
+except ImportError:
+    pass  # dotenv not installed, continue without it
+
+dagshub_url = "https://dagshub.com"
+repo_owner = "trong1234ar"
+repo_name = "water-potability"
+experiment_name = "DVC_Pipeline"
+
+
+def init_tracking() -> str:
+    """Point MLflow at the DagsHub tracking server and set the experiment.
+
+    If MLFLOW_TRACKING_URI is already set (e.g. a local sqlite:// or file://
+    store used by the tests) it is used as-is and DagsHub is never contacted.
+    """
+    tracking_uri = os.getenv("MLFLOW_TRACKING_URI")
+    if not tracking_uri:
+        # THIS IS DUE TO GITHUB ACTION CAN ACCESS - LOCALLY WILL NOT NEED
+        dagshub_token = os.getenv("DAGSHUB_USER_TOKEN") or os.getenv("DAGSHUB_TOKEN")
+        if not dagshub_token:
+            raise ValueError("DAGSHUB_USER_TOKEN or DAGSHUB_TOKEN environment variable is not set")
+        # Set environment variables for MLflow authentication
+        os.environ["MLFLOW_TRACKING_TOKEN"] = dagshub_token
+        os.environ["MLFLOW_TRACKING_PASSWORD"] = dagshub_token
+
+        import dagshub
+        dagshub.init(repo_owner=repo_owner, repo_name=repo_name, mlflow=True)
+        tracking_uri = f"{dagshub_url}/{repo_owner}/{repo_name}.mlflow"
+
+    mlflow.set_tracking_uri(tracking_uri)
+    try:
+        mlflow.set_experiment(experiment_name)
+    except Exception as e:
+        print(f"Warning: Could not set experiment '{experiment_name}': {e}")
+        # Create experiment if it doesn't exist
+        try:
+            mlflow.create_experiment(experiment_name)
+            mlflow.set_experiment(experiment_name)
+        except Exception as create_error:
+            print(f"Error creating experiment: {create_error}")
+            # Use default experiment as fallback
+            print("Using default experiment")
+    return tracking_uri
@@ -0,0 +1,86 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+import numpy as np
+
+from src.data.schema import FEATURE_COLUMNS, TARGET_COLUMN
+from src.features import build_features as bf
+from src.tests.synthetic_data import make_dataset
+
+SPEC = {
+    "ratios": [["Chloramines", "Trihalomethanes"], ["Sulfate", "Solids"]],
+    "log": ["Solids", "Conductivity"],
+    "missing_flags": ["ph", "Sulfate", "Trihalomethanes"],
+}
+
+
+class TestBuildFeatures(unittest.TestCase):
+    """Test engineered features and the feature cache"""
+    def setUp(self):
+        self.data = make_dataset(50)
+        self.data.loc[3, "Trihalomethanes"] = 0
+        self.missing = self.data[FEATURE_COLUMNS].isna()
+        self.missing.loc[[1, 7], "Sulfate"] = True
+        self.missing.loc[7, "ph"] = True
+
+    def test_feature_values(self):
+        features = bf.build_features(self.data, self.missing, SPEC)
+        self.assertEqual(list(features.columns), bf.feature_names(SPEC) + [TARGET_COLUMN])
+        np.testing.assert_allclose(features["Sulfate_per_Solids"], self.data["Sulfate"] / self.data["Solids"], rtol=1e-6)
+        np.testing.assert_allclose(features["log_Solids"], np.log1p(self.data["Solids"]), rtol=1e-6)
+        np.testing.assert_array_equal(features[TARGET_COLUMN], self.data[TARGET_COLUMN])
+
+    def test_zero_denominator_gives_zero(self):
+        features = bf.build_features(self.data, self.missing, SPEC)
+        self.assertEqual(features.loc[3, "Chloramines_per_Trihalomethanes"], 0)
+        self.assertTrue(np.isfinite(features.drop(columns=[TARGET_COLUMN]).to_numpy()).all())
+
+    def test_missing_flags_follow_rows(self):
+        features = bf.build_features(self.data, self.missing, SPEC)
+        self.assertEqual(list(features.index[features["Sulfate_missing"] == 1]), [1, 7])
+        self.assertEqual(list(features.index[features["ph_missing"] == 1]), [7])
+        self.assertEqual(features["Trihalomethanes_missing"].sum(), 0)
+
+    def test_cache_hit_skips_compute(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            expected = bf.build_features(self.data, self.missing, SPEC, tmp)
+            # A fresh copy of the same values, as the serving path would hold
+            data, missing = self.data.copy(), self.missing.copy()
+            with mock.patch.object(bf, "compute_features") as compute:
+                cached = bf.build_features(data, missing, SPEC, tmp)
+            compute.assert_not_called()
+            np.testing.assert_array_equal(cached.to_numpy(), expected.to_numpy())
+
+    def test_cache_invalidated_by_data_spec_or_version(self):
+        changed = self.data.copy()
+        changed.loc[0, "ph"] += 1
+        flags = self.missing.copy()
+        flags.loc[0, "ph"] = True
+        spec = {**SPEC, "log": ["Solids"]}
+        cases = {
+            "same": (self.data, self.missing, SPEC, 1),
+            "values": (changed, self.missing, SPEC, 1),
+            "missing": (self.data, flags, SPEC, 1),
+            "spec": (self.data, self.missing, spec, 1),
+            "version": (self.data, self.missing, SPEC, 2),
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            bf.build_features(self.data, self.missing, SPEC, tmp)
+            for case, (data, missing, spec, version) in cases.items():
+                with self.subTest(case=case), \
+                        mock.patch.object(bf, "FEATURE_SPEC_VERSION", version), \
+                        mock.patch.object(bf, "compute_features", wraps=bf.compute_features) as compute:
+                    bf.build_features(data, missing, spec, tmp)
+                    self.assertEqual(compute.called, case != "same")
+
+    def test_cache_is_bounded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for seed in range(5):
+                data = make_dataset(50, seed=seed)
+                bf.build_features(data, data[FEATURE_COLUMNS].isna(), SPEC, tmp, max_entries=3)
+            self.assertEqual(len(os.listdir(tmp)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+from sklearn.isotonic import IsotonicRegression
+
+from src.model.calibration import CalibrationTable
+
+
+class TestCalibrationTable(unittest.TestCase):
+    """Test calibration lookup table"""
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.scores = rng.uniform(0, 1, 2000)
+        self.y = (rng.uniform(0, 1, 2000) < self.scores ** 2).astype(int)
+
+    def test_table_matches_isotonic_on_grid(self):
+        table = CalibrationTable.fit(self.scores, self.y, "isotonic", size=101)
+        grid = np.linspace(0, 1, 101)
+        expected = IsotonicRegression(y_min=0, y_max=1, out_of_bounds="clip").fit(self.scores, self.y).predict(grid)
+        np.testing.assert_allclose(table.apply(grid), expected, atol=1e-6)
+
+    def test_sigmoid_is_monotonic_and_roundtrips(self):
+        table = CalibrationTable.fit(self.scores, self.y, "sigmoid")
+        self.assertTrue(np.all(np.diff(table.table) >= 0))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "calibration.json")
+            table.save(path)
+            loaded = CalibrationTable.load(path)
+        np.testing.assert_array_equal(loaded.apply(self.scores), table.apply(self.scores))
+
+
+if __name__ == "__main__":
+    unittest.main()
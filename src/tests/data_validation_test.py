@@ -0,0 +1,72 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+from src.data.schema import FEATURE_COLUMNS, COLUMNS
+from src.data.data_validation import check_schema, find_violations, missing_budgets, validate_file
+
+
+def make_frame(n_rows=10):
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.uniform(1, 10, size=(n_rows, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    data["Potability"] = rng.integers(0, 2, size=n_rows)
+    return data
+
+
+class TestDataValidation(unittest.TestCase):
+    """Test the data validation stage"""
+    def test_schema_drift_is_rejected(self):
+        data = make_frame().drop(columns=["Sulfate"])
+        with self.assertRaises(ValueError):
+            check_schema(data)
+
+        data = make_frame()
+        data["ph"] = data["ph"].astype(str)
+        with self.assertRaises(ValueError):
+            check_schema(data)
+
+    def test_range_violations(self):
+        data = make_frame()
+        data.loc[1, "ph"] = 15.0
+        data.loc[2, "Solids"] = -1.0
+        data.loc[3, "ph"] = np.nan
+        data.loc[4, "Potability"] = 2
+
+        range_mask, target_mask = find_violations(
+            data[FEATURE_COLUMNS].to_numpy(dtype=np.float64),
+            data["Potability"].to_numpy(dtype=np.float64),
+        )
+        self.assertEqual(np.flatnonzero(range_mask.any(axis=1)).tolist(), [1, 2])
+        self.assertEqual(np.flatnonzero(target_mask).tolist(), [4])
+
+    def test_validate_file_quarantines_bad_rows(self):
+        data = make_frame(25)
+        data.loc[3, "ph"] = -0.5
+        data.loc[17, "Turbidity"] = -2.0
+        data.loc[5, "Sulfate"] = np.nan
+
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "raw.csv")
+            clean_path = os.path.join(tmp, "clean", "train.csv")
+            quarantine_path = os.path.join(tmp, "quarantine", "train.csv")
+            data.to_csv(input_path, index=False)
+
+            report = validate_file(input_path, clean_path, quarantine_path,
+                                   chunk_size=7, budgets=missing_budgets({"default": 0.0}))
+
+            clean = pd.read_csv(clean_path)
+            quarantine = pd.read_csv(quarantine_path)
+
+        self.assertEqual(report["rows"], 25)
+        self.assertEqual(report["quarantined"], 2)
+        self.assertEqual(report["range_violations"], {"ph": 1, "Turbidity": 1})
+        self.assertEqual(report["missing_budget_exceeded"], ["Sulfate"])
+        self.assertEqual(len(clean), 23)
+        self.assertEqual(len(quarantine), 2)
+        self.assertEqual(list(clean.columns), COLUMNS)
+
+
+if __name__ == "__main__":
+    unittest.main()
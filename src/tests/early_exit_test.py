@@ -0,0 +1,36 @@
+import unittest
+import numpy as np
+
+from src.model.early_exit import EarlyExitForest
+from src.model.model_building import prepare_data, train_model
+from src.tests.synthetic_data import make_dataset
+
+
+class TestEarlyExitForest(unittest.TestCase):
+    """Test block-wise early-exit inference against the full forest"""
+    @classmethod
+    def setUpClass(cls):
+        X, y = prepare_data(make_dataset(600))
+        cls.model = train_model(X[:400], y[:400], 60, n_jobs=1)
+        cls.X = X[400:]
+
+    def test_delta_is_split_over_checks(self):
+        forest = EarlyExitForest(self.model, block_size=10, delta=0.01, min_trees=20)
+        self.assertEqual(forest.n_checks(), 4)  # after 20, 30, 40 and 50 trees
+        single = EarlyExitForest(self.model, block_size=10, delta=0.01 / 4, min_trees=50)
+        self.assertAlmostEqual(forest.bound(30) / single.bound(30), 1.0)
+
+    def test_full_rows_match_forest_scores(self):
+        forest = EarlyExitForest(self.model, block_size=10, delta=0.05, min_trees=20)
+        scores = forest.predict_proba(self.X)
+        full = forest.trees_used == len(self.model.estimators_)
+        self.assertTrue(full.any() and not full.all())
+        np.testing.assert_array_equal(scores[full], self.model.predict_proba(self.X)[full, 1])
+
+    def test_tiny_delta_matches_full_predict(self):
+        forest = EarlyExitForest(self.model, block_size=10, delta=1e-9, min_trees=20)
+        np.testing.assert_array_equal(forest.predict(self.X), self.model.predict(self.X))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import mlflow
+
+from src.model.tracking import init_tracking, experiment_name
+from src.model.model_building import prepare_data, train_model, save_model
+from src.model.model_eval import evaluation_model
+from src.model.model_reg import register_model
+from src.model.registry import RegistryClient
+from src.tests.synthetic_data import make_dataset
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class LocalRegistry:
+    """Offline stand-in for the DagsHub MLflow server.
+
+    Tracking and registry live in a throwaway SQLite database with a file
+    artifact store, selected through MLFLOW_TRACKING_URI so the pipeline code
+    runs unchanged. Every instance gets its own directory, which keeps test
+    processes independent when they run in parallel.
+    """
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self.root = None
+        self.model_path = None
+        self.run_info = None
+        self._saved_uri = None
+
+    def start(self) -> "LocalRegistry":
+        self.root = tempfile.mkdtemp(prefix="mlflow-local-")
+        self._saved_uri = os.environ.get("MLFLOW_TRACKING_URI")
+
+        tracking_uri = f"sqlite:///{os.path.join(self.root, 'mlflow.db')}"
+        os.environ["MLFLOW_TRACKING_URI"] = tracking_uri
+        mlflow.set_tracking_uri(tracking_uri)
+        mlflow.create_experiment(experiment_name, artifact_location=Path(self.root, "artifacts").as_uri())
+        init_tracking()
+        return self
+
+    def stop(self) -> None:
+        if mlflow.active_run():
+            mlflow.end_run()
+        if self._saved_uri is None:
+            os.environ.pop("MLFLOW_TRACKING_URI", None)
+        else:
+            os.environ["MLFLOW_TRACKING_URI"] = self._saved_uri
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def registry_client(self, **kwargs) -> RegistryClient:
+        kwargs.setdefault("cache_path", os.path.join(self.root, "registry_cache.json"))
+        return RegistryClient(**kwargs)
+
+    def run_pipeline(self, n_estimators: int = 20):
+        """Train, evaluate and register a model the same way the DVC stages do."""
+        self.model_path = model_path = os.path.join(self.root, "models", "model.pkl")
+        shutil.copy(REPO_ROOT / "params.yaml", self.root)
+
+        X, y = prepare_data(make_dataset())
+        model = train_model(X[:300], y[:300], n_estimators)
+        save_model(model, model_path)
+
+        # evaluation_model reads params.yaml and writes its plot to the cwd
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            with mlflow.start_run() as run:
+                evaluation_model(model, X[300:], y[300:], self.model_name)
+                mlflow.log_artifact(model_path, self.model_name)
+            self.run_info = {"run_id": run.info.run_id, "model_name": self.model_name}
+            return register_model(self.registry_client(), self.run_info, model_path)
+        finally:
+            os.chdir(cwd)
@@ -0,0 +1,43 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+
+from src.model.model_building import prepare_data, train_model_chunked
+from src.tests.synthetic_data import make_dataset
+
+
+class TestChunkedTraining(unittest.TestCase):
+    """Test out-of-core training over CSV chunks"""
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.tmp.name, "train.csv")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def train(self, n_rows: int, n_estimators: int, chunk_size: int):
+        data = make_dataset(n_rows)
+        data.to_csv(self.data_path, index=False)
+        return data, train_model_chunked(self.data_path, n_estimators, chunk_size, n_jobs=1)
+
+    def test_merged_forest_is_consistent(self):
+        data, model = self.train(400, 30, 100)
+        X, y = prepare_data(data)
+        self.assertEqual(model.n_estimators, 30)
+        self.assertEqual(len(model.estimators_), 30)
+        self.assertEqual(model.oob_decision_function_.shape, (400, 2))
+        self.assertEqual(model.predict_proba(X).shape, (400, 2))
+        self.assertGreater(np.mean(model.predict(X) == y), 0.8)
+
+    def test_uneven_rows_still_train(self):
+        for n_rows, chunk_size in [(401, 100), (430, 100), (470, 100), (99, 100)]:
+            with self.subTest(n_rows=n_rows, chunk_size=chunk_size):
+                _, model = self.train(n_rows, 25, chunk_size)
+                self.assertEqual(len(model.estimators_), 25)
+                self.assertEqual(model.n_estimators, 25)
+                self.assertEqual(len(model.oob_decision_function_), n_rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
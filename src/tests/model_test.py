@@ -1,56 +1,16 @@
 import unittest
-import dagshub
-import mlflow
 from mlflow.tracking import MlflowClient
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 import os
 import pandas as pd
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # This loads .env file if it exists
-except ImportError:
-    pass  # dotenv not installed, continue without it
+from src.model.tracking import init_tracking
+from src.tests.local_registry import LocalRegistry
 
-# Initialize DagsHub for experiment tracking
-# THIS IS DUE TO GITHUB ACTION CAN ACCESS - LOCALLY WILL NOT NEED
-dagshub_token = os.getenv("DAGSHUB_USER_TOKEN") or os.getenv("DAGSHUB_TOKEN")
-if dagshub_token:
-    print("DAGSHUB_TOKEN is set")
-else:
-    print("DAGSHUB_TOKEN is not set")
-# Try to use cached token if environment variable is not set
-if not dagshub_token:
-    try:
-        # This will use the token from dagshub login command or add_app_token()
-        dagshub.auth.add_app_token(dagshub_token) if dagshub_token else None
-    except:
-        pass
-
-if not dagshub_token:
-    raise ValueError("DAGSHUB_USER_TOKEN or DAGSHUB_TOKEN environment variable is not set")
-# Set environment variables for MLflow authentication
-os.environ["MLFLOW_TRACKING_TOKEN"] = dagshub_token
-os.environ["MLFLOW_TRACKING_PASSWORD"] = dagshub_token
-# Configure DagsHub MLflow tracking
-dagshub_url = "https://dagshub.com"
-repo_owner = "trong1234ar"
-repo_name = "water-potability"
-# Initialize DagsHub connection
-dagshub.init(repo_owner=repo_owner, repo_name=repo_name, mlflow=True)
-mlflow.set_tracking_uri(f"{dagshub_url}/{repo_owner}/{repo_name}.mlflow")
-try:
-    mlflow.set_experiment("DVC_Pipeline")
-except Exception as e:
-    print(f"Warning: Could not set experiment 'DVC_Pipeline': {e}")
-    # Create experiment if it doesn't exist
-    try:
-        mlflow.create_experiment("DVC_Pipeline")
-        mlflow.set_experiment("DVC_Pipeline")
-    except Exception as create_error:
-        print(f"Error creating experiment: {create_error}")
-        # Use default experiment as fallback
-        print("Using default experiment")
+# By default the tests run against a local SQLite-backed MLflow stand-in that
+# is trained and registered from scratch, so no network or token is needed.
+# Set MODEL_TEST_REMOTE=1 to check the model registered on DagsHub instead.
+remote = os.getenv("MODEL_TEST_REMOTE") == "1"
 
 model_name = "Best Model"
 
@@ -70,6 +30,20 @@ def get_experiment_id(experiment_name="DVC_Pipeline"):
 
 class TestModelLoading(unittest.TestCase):
     """Test model performance"""
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = None
+        if remote:
+            init_tracking()
+        else:
+            cls.registry = LocalRegistry(model_name).start()
+            cls.registry.run_pipeline()
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.registry:
+            cls.registry.stop()
+
     def test_model_in_staging(self):
         """Test model performance in staging"""
         client = MlflowClient()
@@ -0,0 +1,150 @@
+import unittest
+import json
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from src.model.model_building import prepare_data, train_model, save_model
+from src.tests.synthetic_data import make_dataset
+
+# Committed baseline; regenerate with PERF_UPDATE_BASELINE=1 after an intended change
+baseline_path = Path(__file__).with_name("perf_baseline.json")
+# Kept out of the working tree unless a path is asked for
+report_path = os.getenv("PERF_REPORT") or os.path.join(tempfile.gettempdir(), "perf_report.json")
+
+n_rows = 5000
+n_estimators = 100
+batch_sizes = [1, 100, 1000]
+repeats = 9
+training_repeats = 3
+# Short operations are looped until one sample takes at least this long, so
+# no gated timing rests on a few milliseconds of wall clock
+min_sample_seconds = 0.05
+
+# Allowed ratio to the baseline; timings are first normalised by machine speed
+tolerances = {
+    "training_seconds": 1.6,
+    "artifact_bytes": 1.25,
+    "load_seconds": 1.6,
+    "latency_seconds": 1.6,
+}
+
+
+def per_call_seconds(fn, n: int = repeats) -> float:
+    """Median seconds per call over ``n`` samples of at least min_sample_seconds."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - start >= min_sample_seconds:
+            break
+        number *= 2
+
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return float(np.median(times))
+
+
+def reference_seconds() -> float:
+    """Fixed NumPy workload used to normalise timings across machines."""
+    rng = np.random.default_rng(0)
+    a = rng.normal(size=(300, 300))
+    values = rng.normal(size=500_000)
+    # Single-threaded like the gated work, so core count and load don't skew it
+    with threadpool_limits(limits=1):
+        return per_call_seconds(lambda: (np.sort(values), a @ a))
+
+
+def measure() -> dict:
+    X, y = prepare_data(make_dataset(n_rows))
+    fits = []
+    for _ in range(training_repeats):
+        start = time.perf_counter()
+        model = train_model(X, y, n_estimators, n_jobs=1)
+        fits.append(time.perf_counter() - start)
+    training_seconds = float(np.median(fits))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "model.pkl")
+        save_model(model, model_path)
+        artifact_bytes = os.path.getsize(model_path)
+
+        def load():
+            with open(model_path, "rb") as file:
+                return pickle.load(file)
+        load_seconds = per_call_seconds(load)
+
+    model.n_jobs = 1
+    latency = {
+        str(size): per_call_seconds(lambda: model.predict_proba(X[:size])) for size in batch_sizes
+    }
+    return {
+        "reference_seconds": reference_seconds(),
+        "training_seconds": training_seconds,
+        "artifact_bytes": artifact_bytes,
+        "load_seconds": load_seconds,
+        "latency_seconds": latency,
+    }
+
+
+def write_report(results: dict, baseline: dict, failures: list) -> None:
+    report = {"perf_gate": {"results": results, "baseline": baseline, "failures": failures}}
+    os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+    with open(report_path, "w") as file:
+        json.dump(report, file, indent=4)
+
+
+class TestPerformanceGate(unittest.TestCase):
+    """Compare training / artifact / load / inference costs with the committed baseline"""
+    @classmethod
+    def setUpClass(cls):
+        if os.getenv("PERF_UPDATE_BASELINE") != "1" and not baseline_path.exists():
+            raise FileNotFoundError(f"{baseline_path} is missing; record one with PERF_UPDATE_BASELINE=1")
+        cls.results = measure()
+        if os.getenv("PERF_UPDATE_BASELINE") == "1":
+            with open(baseline_path, "w") as file:
+                json.dump(cls.results, file, indent=4)
+        with open(baseline_path, "r") as file:
+            cls.baseline = json.load(file)
+        # > 1 when this machine is slower than the one that made the baseline
+        cls.speed = cls.results["reference_seconds"] / cls.baseline["reference_seconds"]
+        cls.failures = []
+
+    @classmethod
+    def tearDownClass(cls):
+        write_report(cls.results, cls.baseline, cls.failures)
+
+    def check(self, name: str, current: float, baseline: float, timed: bool = True):
+        metric = name.split("[")[0]
+        ratio = current / baseline / (self.speed if timed else 1.0)
+        tolerance = tolerances[metric]
+        if ratio > tolerance:
+            self.failures.append({"metric": name, "ratio": ratio, "tolerance": tolerance})
+        self.assertLessEqual(ratio, tolerance, f"{name} regressed: {ratio:.2f}x baseline (tolerance {tolerance}x)")
+
+    def test_training_time(self):
+        self.check("training_seconds", self.results["training_seconds"], self.baseline["training_seconds"])
+
+    def test_artifact_size(self):
+        self.check("artifact_bytes", self.results["artifact_bytes"], self.baseline["artifact_bytes"], timed=False)
+
+    def test_load_time(self):
+        self.check("load_seconds", self.results["load_seconds"], self.baseline["load_seconds"])
+
+    def test_inference_latency(self):
+        for size, seconds in self.results["latency_seconds"].items():
+            with self.subTest(batch_size=size):
+                self.check(f"latency_seconds[{size}]", seconds, self.baseline["latency_seconds"][size])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from unittest import mock
+from mlflow.tracking import MlflowClient
+
+from src.model.registry import RegistryClient, file_hash
+from src.tests.local_registry import LocalRegistry
+
+model_name = "Registry Test"
+
+
+class FlakyClient:
+    """Forwards to a real MlflowClient but fails the first few calls"""
+    def __init__(self, client, failures=0, create_failures=0):
+        self.client = client
+        self.failures = failures
+        self.create_failures = create_failures
+        self.calls = 0
+        self.creates = 0
+
+    def search_model_versions(self, *args, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("registry unavailable")
+        return self.client.search_model_versions(*args, **kwargs)
+
+    def create_model_version(self, *args, **kwargs):
+        # The version is created on the server but the response is lost
+        mv = self.client.create_model_version(*args, **kwargs)
+        self.creates += 1
+        if self.creates <= self.create_failures:
+            raise TimeoutError("response lost")
+        return mv
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+class TestRegistryClient(unittest.TestCase):
+    """Test registry client against the local MLflow stand-in"""
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = LocalRegistry(model_name).start()
+        cls.version = cls.registry.run_pipeline()
+        cls.content_hash = file_hash(cls.registry.model_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.registry.stop()
+
+    def register(self, client, name=model_name, content_hash=None):
+        run_id = self.registry.run_info["run_id"]
+        return client.register(name, source=f"runs:/{run_id}/{model_name}", run_id=run_id,
+                               content_hash=content_hash or self.content_hash)
+
+    def test_same_content_is_noop(self):
+        version, created = self.register(RegistryClient())
+        self.assertFalse(created)
+        self.assertEqual(version["version"], self.version["version"])
+        self.assertEqual(len(MlflowClient().search_model_versions(f"name = '{model_name}'")), 1)
+
+    def test_new_content_registers_and_sets_alias(self):
+        name = "Registry Test New Content"
+        version, created = self.register(RegistryClient(), name=name, content_hash="0" * 64)
+        self.assertTrue(created)
+        staging = MlflowClient().get_model_version_by_alias(name, "staging")
+        self.assertEqual(str(staging.version), version["version"])
+
+    def test_cached_lookup_skips_registry(self):
+        client = self.registry.registry_client()
+        client.find_version(model_name, self.content_hash)
+
+        client.client = mock.Mock(spec=MlflowClient)
+        version, created = self.register(client)
+        self.assertFalse(created)
+        self.assertEqual(version["version"], self.version["version"])
+        self.assertEqual(client.client.method_calls, [])
+
+        client.cache_ttl = 0
+        client.client = mock.Mock(search_model_versions=mock.Mock(return_value=[]))
+        self.assertIsNone(client.find_version(model_name, self.content_hash))
+
+    def test_lost_create_response_is_not_registered_twice(self):
+        name = "Registry Test Lost Response"
+        flaky = FlakyClient(MlflowClient(), create_failures=1)
+        client = RegistryClient(client=flaky, max_retries=2, backoff_seconds=0)
+        version, created = self.register(client, name=name, content_hash="1" * 64)
+
+        self.assertTrue(created)
+        self.assertEqual(flaky.creates, 1)
+        versions = MlflowClient().search_model_versions(f"name = '{name}'")
+        self.assertEqual([str(v.version) for v in versions], [version["version"]])
+        staging = MlflowClient().get_model_version_by_alias(name, "staging")
+        self.assertEqual(str(staging.version), version["version"])
+
+    def test_retries_transient_errors(self):
+        flaky = FlakyClient(MlflowClient(), failures=2)
+        client = RegistryClient(client=flaky, max_retries=2, backoff_seconds=0)
+        self.assertEqual(client.find_version(model_name, self.content_hash)["version"], self.version["version"])
+        self.assertEqual(flaky.calls, 3)
+
+        flaky = FlakyClient(MlflowClient(), failures=3)
+        client = RegistryClient(client=flaky, max_retries=2, backoff_seconds=0)
+        with self.assertRaises(ConnectionError):
+            client.find_version(model_name, self.content_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
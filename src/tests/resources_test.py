@@ -0,0 +1,61 @@
+import unittest
+import json
+import os
+import tempfile
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_info
+
+from src.model.resources import ResourceBudget, available_cores, record_layout
+
+
+class TestResourceBudget(unittest.TestCase):
+    """Test core budget layouts"""
+    def test_workers_and_blas_threads_fit_budget(self):
+        budget = ResourceBudget(cores=1, tasks={"serving": {"backend": "processes", "workers": 4}})
+        layout = budget.layout("serving")
+        self.assertEqual(layout["backend"], "processes")
+        self.assertLessEqual(layout["n_jobs"] * layout["blas_threads"], budget.cores)
+
+        budget.cores = 8
+        self.assertEqual(budget.layout("serving")["n_jobs"], 4)
+        self.assertEqual(budget.layout("serving")["blas_threads"], 2)
+        self.assertEqual(budget.layout("training")["n_jobs"], 8)
+        self.assertEqual(budget.layout("training")["blas_threads"], 1)
+
+    def test_cores_never_exceed_machine(self):
+        self.assertEqual(ResourceBudget(cores=10 ** 6).cores, available_cores())
+
+    def test_limit_caps_blas_threads(self):
+        budget = ResourceBudget(tasks={"training": {"workers": None}})
+        with budget.limit("training") as layout:
+            blas = [pool for pool in threadpool_info() if pool["user_api"] == "blas"]
+            self.assertTrue(all(pool["num_threads"] == layout["blas_threads"] for pool in blas))
+
+    def test_limit_applies_backend(self):
+        for backend, in_parent in [("threads", True), ("processes", False)]:
+            budget = ResourceBudget(cores=2, tasks={"training": {"backend": backend, "workers": 2}})
+            with self.subTest(backend=backend), budget.limit("training"):
+                # Forests run their trees through joblib with prefer="threads"
+                pids = Parallel(n_jobs=2, prefer="threads")(delayed(os.getpid)() for _ in range(4))
+                self.assertEqual(set(pids) == {os.getpid()}, in_parent)
+
+    def test_unknown_backend_is_rejected(self):
+        budget = ResourceBudget(tasks={"training": {"backend": "gpu"}})
+        with self.assertRaises(ValueError):
+            budget.layout("training")
+
+    def test_record_layout_writes_only_its_own_report(self):
+        budget = ResourceBudget(cores=4)
+        with tempfile.TemporaryDirectory() as tmp:
+            training = os.path.join(tmp, "resources", "model_building.json")
+            scoring = os.path.join(tmp, "resources", "model_eval.json")
+            record_layout(budget.layout("training"), training)
+            record_layout(budget.layout("batch_scoring"), scoring)
+            with open(training, "r") as file:
+                self.assertEqual(json.load(file), budget.layout("training"))
+            with open(scoring, "r") as file:
+                self.assertEqual(json.load(file)["task"], "batch_scoring")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import io
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+
+from src.data.schema import FEATURE_COLUMNS, TARGET_COLUMN, DTYPES
+
+
+def make_csv(n_rows=500):
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame(rng.normal(100, 30, size=(n_rows, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    data[TARGET_COLUMN] = (data["ph"] + rng.normal(0, 20, n_rows) > 100).astype(int)
+    return data.to_csv(index=False)
+
+
+class TestCompactSchema(unittest.TestCase):
+    """Test that the compact dtype schema saves memory without changing the model"""
+    def test_memory_is_halved(self):
+        csv = make_csv()
+        wide = pd.read_csv(io.StringIO(csv))
+        compact = pd.read_csv(io.StringIO(csv), dtype=DTYPES)
+
+        self.assertTrue(all(compact[c].dtype == np.float32 for c in FEATURE_COLUMNS))
+        self.assertEqual(compact[TARGET_COLUMN].dtype, np.int8)
+        self.assertLessEqual(compact.memory_usage(index=False).sum(),
+                             wide.memory_usage(index=False).sum() / 2)
+
+    def test_accuracy_unchanged(self):
+        csv = make_csv()
+        wide = pd.read_csv(io.StringIO(csv))
+        compact = pd.read_csv(io.StringIO(csv), dtype=DTYPES)
+        train, test = slice(0, 350), slice(350, None)
+
+        scores = []
+        for data in (wide, compact):
+            X, y = data[FEATURE_COLUMNS], data[TARGET_COLUMN]
+            clf = RandomForestClassifier(n_estimators=25, random_state=0)
+            clf.fit(X[train], y[train])
+            scores.append(accuracy_score(y[test], clf.predict(X[test])))
+
+        self.assertEqual(scores[0], scores[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import os
+import tempfile
+import threading
+from unittest import mock
+import numpy as np
+
+from src.model.model_building import prepare_data, train_model, save_model
+from src.model.resources import ResourceBudget
+from src.model.serving import ModelServer
+from src.tests.synthetic_data import make_dataset
+
+
+class TestModelServer(unittest.TestCase):
+    """Test preloaded worker-pool serving and hot swap"""
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        X, y = prepare_data(make_dataset(200))
+        cls.X = X
+        cls.model_paths = []
+        for version, n_rows in enumerate([150, 200]):
+            model = train_model(X[:n_rows], y[:n_rows], 10, n_jobs=1)
+            path = os.path.join(cls.tmp.name, f"model_{version}.pkl")
+            save_model(model, path)
+            cls.model_paths.append(path)
+        cls.budget = ResourceBudget(cores=2, tasks={"serving": {"backend": "processes", "workers": 2}})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_threads_backend_is_rejected(self):
+        budget = ResourceBudget(tasks={"serving": {"backend": "threads"}})
+        with self.assertRaises(ValueError):
+            ModelServer(budget)
+
+    def test_requests_survive_swaps(self):
+        server = ModelServer(self.budget, warmup_batch_sizes=[1], warmup_rounds=1)
+        server.start(self.model_paths[0])
+        failures, done, pools = [], threading.Event(), []
+        start_pool = server._start_pool
+
+        def record_pool(*args):
+            pool, seconds = start_pool(*args)
+            pools.append(pool)
+            return pool, seconds
+
+        def client():
+            while not done.is_set():
+                try:
+                    scores = server.predict_proba(self.X.iloc[:20])
+                    if scores.shape != (20,) or not np.all((scores >= 0) & (scores <= 1)):
+                        failures.append(f"bad scores {scores}")
+                except Exception as e:
+                    failures.append(repr(e))
+
+        def swap(model_path):
+            try:
+                server.swap(model_path)
+            except Exception as e:
+                failures.append(repr(e))
+
+        clients = [threading.Thread(target=client) for _ in range(4)]
+        for thread in clients:
+            thread.start()
+        try:
+            server._start_pool = mock.Mock(side_effect=record_pool)
+            # Concurrent swaps must be serialized, not retire each other's pools
+            swappers = [threading.Thread(target=swap, args=(self.model_paths[i % 2],)) for i in range(4)]
+            for thread in swappers:
+                thread.start()
+            for thread in swappers:
+                thread.join()
+        finally:
+            done.set()
+            for thread in clients:
+                thread.join()
+            current = server._pool
+            server.stop()
+
+        self.assertEqual(failures, [])
+        self.assertEqual(len(pools), 4)
+        # Every pool but the one being served was retired, none leaked
+        self.assertEqual([pool is current for pool in pools], [False] * 3 + [True])
+        self.assertTrue(all(pool._state != "RUN" for pool in pools[:3]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,12 @@
+import numpy as np
+import pandas as pd
+
+from src.data.schema import FEATURE_COLUMNS, TARGET_COLUMN, DTYPES
+
+
+def make_dataset(n_rows: int = 400, seed: int = 0) -> pd.DataFrame:
+    """Small, easily separable synthetic dataset with the real column layout."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(rng.uniform(0, 14, size=(n_rows, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    data[TARGET_COLUMN] = (data["ph"] + rng.normal(0, 0.5, n_rows) > 7).astype(int)
+    return data.astype(DTYPES)
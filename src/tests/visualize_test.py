@@ -0,0 +1,34 @@
+import unittest
+import os
+import tempfile
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.tests.synthetic_data import make_dataset
+from src.visualization.visualize import compute_aggregates, hexbin_aggregate, render_all
+
+
+class TestVisualization(unittest.TestCase):
+    """Test aggregated EDA rendering"""
+    def test_hexbin_matches_matplotlib(self):
+        rng = np.random.default_rng(0)
+        x, y = rng.normal(7, 2, 5000), rng.normal(300, 40, 5000)
+        agg = hexbin_aggregate(x, y, gridsize=25)
+
+        fig, ax = plt.subplots()
+        reference = ax.hexbin(x, y, gridsize=agg["gridsize"], extent=agg["extent"], mincnt=1).get_array()
+        plt.close(fig)
+
+        self.assertEqual(agg["counts"].sum(), 5000)
+        self.assertEqual(sorted(agg["counts"]), sorted(reference.astype(int)))
+
+    def test_render_closes_figures(self):
+        aggregates = compute_aggregates(make_dataset(), bins=10, gridsize=10, hexbin_pairs=[("ph", "Sulfate")])
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = render_all(aggregates, tmp)
+            self.assertTrue(all(os.path.exists(p) for p in paths))
+        self.assertEqual(plt.get_fignums(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
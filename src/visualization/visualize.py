@@ -0,0 +1,197 @@
+import os
+import numpy as np
+import pandas as pd
+import yaml
+import matplotlib
+matplotlib.use("Agg")  # headless, no GUI event loop
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+from src.data.schema import FEATURE_COLUMNS, TARGET_COLUMN, DTYPES
+
+# Everything is rendered from precomputed aggregates (counts per bin / cell,
+# a correlation matrix), so drawing cost depends on bin count, not row count.
+
+
+def load_params(params_path: str) -> dict:
+    try:
+        with open(params_path, "r") as file:
+            params = yaml.safe_load(file)
+        return params["visualization"]
+    except Exception as e:
+        raise Exception(f"Error loading parameters from {params_path}: {e}")
+
+
+def plots_enabled(params: dict) -> bool:
+    # SKIP_PLOTS=1 turns plotting off for fast runs regardless of params.yaml
+    return params.get("enabled", True) and os.getenv("SKIP_PLOTS") != "1"
+
+
+def load_data(filepath: str) -> pd.DataFrame:
+    try:
+        return pd.read_csv(filepath, dtype=DTYPES)
+    except Exception as e:
+        raise Exception(f"Error loading data from {filepath}: {e}")
+
+
+# --- aggregation
+
+def histogram_aggregates(values: np.ndarray, target: np.ndarray, bins: int) -> dict:
+    """Overall and per-class histograms for every column of ``values``."""
+    aggregates = {}
+    classes = np.unique(target)
+    for i, column in enumerate(FEATURE_COLUMNS):
+        x = values[:, i]
+        valid = ~np.isnan(x)
+        counts, edges = np.histogram(x[valid], bins=bins)
+        per_class = {
+            int(c): np.histogram(x[valid & (target == c)], bins=edges)[0] for c in classes
+        }
+        aggregates[column] = {"edges": edges, "counts": counts, "per_class": per_class}
+    return aggregates
+
+
+def hexbin_aggregate(x: np.ndarray, y: np.ndarray, gridsize: int) -> dict:
+    """Counts on a hexagonal grid, same lattice layout as matplotlib's hexbin."""
+    valid = ~(np.isnan(x) | np.isnan(y))
+    x, y = x[valid].astype(np.float64), y[valid].astype(np.float64)
+    xmin, xmax, ymin, ymax = x.min(), x.max(), y.min(), y.max()
+    nx = gridsize
+    ny = max(int(round(gridsize / np.sqrt(3))), 1)
+    sx = (xmax - xmin) / nx or 1.0
+    sy = (ymax - ymin) / ny or 1.0
+
+    ix, iy = (x - xmin) / sx, (y - ymin) / sy
+    ix1, iy1 = np.round(ix).astype(np.int64), np.round(iy).astype(np.int64)
+    ix2, iy2 = np.floor(ix).astype(np.int64), np.floor(iy).astype(np.int64)
+    # Each point belongs to the nearer of the two interleaved lattices
+    on_first = (ix - ix1) ** 2 + 3 * (iy - iy1) ** 2 < (ix - ix2 - 0.5) ** 2 + 3 * (iy - iy2 - 0.5) ** 2
+
+    ix2, iy2 = np.minimum(ix2, nx - 1), np.minimum(iy2, ny - 1)
+    first = np.bincount(ix1[on_first] * (ny + 1) + iy1[on_first], minlength=(nx + 1) * (ny + 1))
+    second = np.bincount(ix2[~on_first] * ny + iy2[~on_first], minlength=nx * ny)
+
+    gx1, gy1 = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), indexing="ij")
+    gx2, gy2 = np.meshgrid(np.arange(nx) + 0.5, np.arange(ny) + 0.5, indexing="ij")
+    centers_x = xmin + sx * np.concatenate([gx1.ravel(), gx2.ravel()])
+    centers_y = ymin + sy * np.concatenate([gy1.ravel(), gy2.ravel()])
+    counts = np.concatenate([first, second])
+
+    occupied = counts > 0
+    return {
+        "x": centers_x[occupied],
+        "y": centers_y[occupied],
+        "counts": counts[occupied],
+        "extent": (xmin, xmax, ymin, ymax),
+        "gridsize": (nx, ny),
+    }
+
+
+def correlation_aggregate(values: np.ndarray) -> np.ndarray:
+    complete = values[~np.isnan(values).any(axis=1)].astype(np.float64)
+    return np.corrcoef(complete, rowvar=False)
+
+
+def compute_aggregates(data: pd.DataFrame, bins: int, gridsize: int, hexbin_pairs: list) -> dict:
+    try:
+        values = data[FEATURE_COLUMNS].to_numpy()
+        target = data[TARGET_COLUMN].to_numpy()
+        return {
+            "histograms": histogram_aggregates(values, target, bins),
+            "hexbins": {
+                (a, b): hexbin_aggregate(data[a].to_numpy(), data[b].to_numpy(), gridsize)
+                for a, b in hexbin_pairs
+            },
+            "correlation": correlation_aggregate(values),
+        }
+    except Exception as e:
+        raise Exception(f"Error computing plot aggregates: {e}")
+
+
+# --- rendering
+
+def save_figure(fig, path: str) -> None:
+    # Always close so long runs don't accumulate open figures
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fig.savefig(path, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+
+
+def plot_histograms(histograms: dict, path: str) -> None:
+    fig, axes = plt.subplots(3, 3, figsize=(12, 10))
+    for ax, (column, agg) in zip(axes.ravel(), histograms.items()):
+        ax.stairs(agg["counts"], agg["edges"], fill=True, color="lightgrey", label="all")
+        for label, counts in agg["per_class"].items():
+            ax.stairs(counts, agg["edges"], label=f"{TARGET_COLUMN}={label}")
+        ax.set_title(column)
+    axes[0, 0].legend(fontsize="small")
+    fig.tight_layout()
+    save_figure(fig, path)
+
+
+def plot_hexbin(agg: dict, x_label: str, y_label: str, path: str) -> None:
+    fig, ax = plt.subplots(figsize=(6, 5))
+    # One weighted point per occupied cell reproduces the density plot
+    image = ax.hexbin(agg["x"], agg["y"], C=agg["counts"], reduce_C_function=np.sum,
+                      gridsize=agg["gridsize"], extent=agg["extent"], cmap="viridis")
+    fig.colorbar(image, ax=ax, label="count")
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    save_figure(fig, path)
+
+
+def plot_correlation(corr: np.ndarray, path: str) -> None:
+    fig, ax = plt.subplots(figsize=(8, 7))
+    sns.heatmap(corr, annot=True, fmt=".2f", cmap="coolwarm", vmin=-1, vmax=1,
+                xticklabels=FEATURE_COLUMNS, yticklabels=FEATURE_COLUMNS, ax=ax)
+    ax.set_title("Feature correlation")
+    save_figure(fig, path)
+
+
+def plot_confusion_matrix(cm: np.ndarray, title: str, path: str) -> None:
+    fig, ax = plt.subplots(figsize=(5, 5))
+    sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax)
+    ax.set_xlabel("Predicted")
+    ax.set_ylabel("Actual")
+    ax.set_title(title)
+    save_figure(fig, path)
+
+
+def render_all(aggregates: dict, figures_path: str) -> list[str]:
+    try:
+        paths = [os.path.join(figures_path, "histograms.png"), os.path.join(figures_path, "correlation.png")]
+        plot_histograms(aggregates["histograms"], paths[0])
+        plot_correlation(aggregates["correlation"], paths[1])
+        for (a, b), agg in aggregates["hexbins"].items():
+            path = os.path.join(figures_path, f"hexbin_{a}_{b}.png")
+            plot_hexbin(agg, a, b, path)
+            paths.append(path)
+        return paths
+    except Exception as e:
+        raise Exception(f"Error rendering figures: {e}")
+
+
+def main():
+    try:
+        params_path = "params.yaml"
+        data_path = "./data/processed/train_processed.csv"
+        figures_path = "reports/figures"
+
+        params = load_params(params_path)
+        os.makedirs(figures_path, exist_ok=True)
+        if not plots_enabled(params):
+            print("Plotting disabled, skipping EDA figures")
+            return
+
+        data = load_data(data_path)
+        aggregates = compute_aggregates(data, params["bins"], params["hexbin_gridsize"], params["hexbin_pairs"])
+        for path in render_all(aggregates, figures_path):
+            print(f"Saved {path}")
+    except Exception as e:
+        raise Exception(f"An error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()